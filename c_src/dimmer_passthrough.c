@@ -4,11 +4,20 @@
 #include <unistd.h>
 #include <stdio.h>
 #include <stdlib.h>
+#include <string.h>
 
 int main(int argc, char *argv[]) {
     Display *d = XOpenDisplay(NULL);
     if (!d) return 1;
     
+    // --stdin: stay alive and read one level per line instead of exiting
+    int stdin_mode = 0;
+    int arg = 1;
+    if (argc > 1 && strcmp(argv[1], "--stdin") == 0) {
+        stdin_mode = 1;
+        arg = 2;
+    }
+    
     int s = DefaultScreen(d);
     Window root = RootWindow(d, s);
     
@@ -33,20 +42,18 @@ int main(int argc, char *argv[]) {
     Atom desktop_type = XInternAtom(d, "_NET_WM_WINDOW_TYPE_DESKTOP", False);
     XChangeProperty(d, w, window_type, XA_ATOM, 32, PropModeReplace, (unsigned char*)&desktop_type, 1);
     
-    int level = 3;
-    if (argc > 1) level = atoi(argv[1]);
-    if (level < 1) level = 1;
+    // In stdin mode level 0 keeps the overlay unmapped until a level arrives
+    int level = stdin_mode ? 0 : 3;
+    if (argc > arg) level = atoi(argv[arg]);
+    if (level < 1 && !stdin_mode) level = 1;
+    if (level < 0) level = 0;
     if (level > 5) level = 5;
     
-    unsigned long opacity;
-    switch(level) {
-        case 1: opacity = 0x33000000; break;
-        case 2: opacity = 0x66000000; break;
-        case 3: opacity = 0x99000000; break;
-        case 4: opacity = 0xCC000000; break;
-        case 5: opacity = 0xFF000000; break;
-        default: opacity = 0x99000000;
-    }
+    // Index = level, 0 is only used while unmapped
+    static const unsigned long opacities[] = {
+        0x00000000, 0x33000000, 0x66000000, 0x99000000, 0xCC000000, 0xFF000000
+    };
+    unsigned long opacity = opacities[level];
     
     Atom opacity_atom = XInternAtom(d, "_NET_WM_WINDOW_OPACITY", False);
     XChangeProperty(d, w, opacity_atom, XA_CARDINAL, 32, PropModeReplace, (unsigned char*)&opacity, 1);
@@ -58,11 +65,66 @@ int main(int argc, char *argv[]) {
         XDestroyRegion(region);
     }
     
-    XMapWindow(d, w);
+    int mapped = 0;
+    if (level > 0) {
+        XMapWindow(d, w);
+        mapped = 1;
+    }
     XFlush(d);
     XSync(d, False);
     
-    sleep(3600);
+    if (!stdin_mode) {
+        sleep(3600);
+    } else {
+        // Reuse the same connection and window for every update; EOF = quit.
+        // Levels queued since the last read are drained together and only
+        // the newest complete line is applied, so a burst costs one flush.
+        char buf[256];
+        size_t len = 0;
+        ssize_t n;
+        while ((n = read(STDIN_FILENO, buf + len, sizeof(buf) - 1 - len)) > 0) {
+            len += n;
+            buf[len] = '\0';
+            
+            char *end = strrchr(buf, '\n');
+            if (!end) {
+                // Drop an overlong line that never ends
+                if (len == sizeof(buf) - 1) len = 0;
+                continue;
+            }
+            *end = '\0';
+            char *line = strrchr(buf, '\n');
+            char *start = line ? line + 1 : buf;
+            char *num_end;
+            long next = strtol(start, &num_end, 10);
+            int valid = num_end != start;  // strtol leaves num_end at start without digits
+            while (*num_end == ' ' || *num_end == '\t' || *num_end == '\r') num_end++;
+            if (*num_end != '\0') valid = 0;
+            
+            // Keep a partial line that arrived after the last newline
+            size_t rest = len - (size_t)(end + 1 - buf);
+            memmove(buf, end + 1, rest);
+            len = rest;
+            
+            // An empty or non-numeric line is ignored rather than read as 0
+            if (!valid) continue;
+            if (next < 0) next = 0;
+            if (next > 5) next = 5;
+            if (next == level) continue;
+            level = (int)next;
+            
+            if (level == 0) {
+                if (mapped) XUnmapWindow(d, w);
+                mapped = 0;
+            } else {
+                opacity = opacities[level];
+                XChangeProperty(d, w, opacity_atom, XA_CARDINAL, 32, PropModeReplace, (unsigned char*)&opacity, 1);
+                if (!mapped) XMapRaised(d, w);
+                mapped = 1;
+            }
+            XFlush(d);
+        }
+    }
     
     XDestroyWindow(d, w);
     XCloseDisplay(d);
@@ -4,11 +4,20 @@
 #include <unistd.h>
 #include <stdio.h>
 #include <stdlib.h>
+#include <string.h>
 
 int main(int argc, char *argv[]) {
     Display *d = XOpenDisplay(NULL);
     if (!d) return 1;
     
+    // --stdin: stay alive and read one level per line instead of exiting
+    int stdin_mode = 0;
+    int arg = 1;
+    if (argc > 1 && strcmp(argv[1], "--stdin") == 0) {
+        stdin_mode = 1;
+        arg = 2;
+    }
+    
     int s = DefaultScreen(d);
     Window root = RootWindow(d, s);
     
@@ -34,9 +43,11 @@ int main(int argc, char *argv[]) {
     XChangeProperty(d, w, window_type, XA_ATOM, 32, PropModeReplace, (unsigned char*)&desktop_type, 1);
     
     // 20 levels: 1=5% dark (brightest) to 20=100% dark (black)
-    int level = 10; // Default 50%
-    if (argc > 1) level = atoi(argv[1]);
-    if (level < 1) level = 1;
+    // In stdin mode level 0 keeps the overlay unmapped until a level arrives
+    int level = stdin_mode ? 0 : 10; // Default 50%
+    if (argc > arg) level = atoi(argv[arg]);
+    if (level < 1 && !stdin_mode) level = 1;
+    if (level < 0) level = 0;
     if (level > 20) level = 20;
     
     // Convert level to opacity (level 20 = 0xFF000000 = fully opaque black)
@@ -53,11 +64,66 @@ int main(int argc, char *argv[]) {
         XDestroyRegion(region);
     }
     
-    XMapWindow(d, w);
+    int mapped = 0;
+    if (level > 0) {
+        XMapWindow(d, w);
+        mapped = 1;
+    }
     XFlush(d);
     XSync(d, False);
     
-    sleep(3600);
+    if (!stdin_mode) {
+        sleep(3600);
+    } else {
+        // Reuse the same connection and window for every update; EOF = quit.
+        // Levels queued since the last read are drained together and only
+        // the newest complete line is applied, so a burst costs one flush.
+        char buf[256];
+        size_t len = 0;
+        ssize_t n;
+        while ((n = read(STDIN_FILENO, buf + len, sizeof(buf) - 1 - len)) > 0) {
+            len += n;
+            buf[len] = '\0';
+            
+            char *end = strrchr(buf, '\n');
+            if (!end) {
+                // Drop an overlong line that never ends
+                if (len == sizeof(buf) - 1) len = 0;
+                continue;
+            }
+            *end = '\0';
+            char *line = strrchr(buf, '\n');
+            char *start = line ? line + 1 : buf;
+            char *num_end;
+            long next = strtol(start, &num_end, 10);
+            int valid = num_end != start;  // strtol leaves num_end at start without digits
+            while (*num_end == ' ' || *num_end == '\t' || *num_end == '\r') num_end++;
+            if (*num_end != '\0') valid = 0;
+            
+            // Keep a partial line that arrived after the last newline
+            size_t rest = len - (size_t)(end + 1 - buf);
+            memmove(buf, end + 1, rest);
+            len = rest;
+            
+            // An empty or non-numeric line is ignored rather than read as 0
+            if (!valid) continue;
+            if (next < 0) next = 0;
+            if (next > 20) next = 20;
+            if (next == level) continue;
+            level = (int)next;
+            
+            if (level == 0) {
+                if (mapped) XUnmapWindow(d, w);
+                mapped = 0;
+            } else {
+                opacity = (unsigned long long)level * 0xFF000000ULL / 20ULL;
+                XChangeProperty(d, w, opacity_atom, XA_CARDINAL, 32, PropModeReplace, (unsigned char*)&opacity, 1);
+                if (!mapped) XMapRaised(d, w);
+                mapped = 1;
+            }
+            XFlush(d);
+        }
+    }
     
     XDestroyWindow(d, w);
     XCloseDisplay(d);
@@ -8,14 +8,33 @@ Runs in the background and provides quick access to dimmer settings.
 import gi
 import subprocess
 import os
+import re
 import signal
+import stat
 import sys
 import json
+import logging
+import time
+from types import MappingProxyType
+from typing import NamedTuple
+
+# orjson is optional; fall back to the stdlib json module when it is missing
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        # Compact separators, matching orjson's output
+        return json.dumps(obj, separators=(',', ':')).encode()
+    _loads = json.loads
 
 gi.require_version('Gtk', '3.0')
-gi.require_version('AppIndicator3', '0.1')
-gi.require_version('Notify', '0.7')
-from gi.repository import Gtk, AppIndicator3, GLib, Notify
+from gi.repository import Gtk, Gdk, GLib, Gio
+
+# Tray-only GI modules, imported by load_tray_modules() when DimmerTray starts
+AppIndicator3 = None
+Notify = None
 
 # Get the directory where this script is located
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -26,6 +45,12 @@ DIMMER_BINARY = os.path.join(PROJECT_ROOT, 'bin', 'dimmer_passthrough')
 # Icon path
 ICON_PATH = os.path.join(SCRIPT_DIR, 'assets', 'dimmer.svg')
 
+# KDE Night Light D-Bus endpoint (service, object path, interface)
+NIGHT_LIGHT_DBUS = ('org.kde.KWin', '/org/kde/KWin/NightLight', 'org.kde.KWin.NightLight')
+
+# Shared /dev/null for child stdout/stderr, opened once instead of per spawn
+DEVNULL_FD = os.open(os.devnull, os.O_RDWR)
+
 # Config file path
 CONFIG_DIR = os.path.expanduser('~/.config/dimmer')
 CONFIG_FILE = os.path.join(CONFIG_DIR, 'config.json')
@@ -33,22 +58,115 @@ CONFIG_FILE = os.path.join(CONFIG_DIR, 'config.json')
 # Global reference to prevent garbage collection
 app = None
 
-# Initialize notification system
-Notify.init("Dimmer")
+# Debug output is off unless DIMMER_DEBUG is set; log calls format lazily
+# Same stream and [LEVEL] prefixes as the old print() output
+logging.addLevelName(logging.WARNING, "WARN")
+logging.basicConfig(stream=sys.stdout, format="[%(levelname)s] %(message)s")
+log = logging.getLogger("dimmer")
+log.setLevel(logging.DEBUG if os.environ.get("DIMMER_DEBUG") else logging.INFO)
+
+
+def load_tray_modules():
+    """Import AppIndicator3 and Notify on first use and initialize Notify."""
+    global AppIndicator3, Notify
+    if Notify is not None:
+        return
+    gi.require_version('AppIndicator3', '0.1')
+    gi.require_version('Notify', '0.7')
+    from gi.repository import AppIndicator3 as indicator_module, Notify as notify_module
+    
+    # Initialize notification system
+    notify_module.init("Dimmer")
+    AppIndicator3, Notify = indicator_module, notify_module
+
 
 # Level descriptions for 20-level system (5% steps)
 # We won't map every single level to a name, just key ones for the menu
 # 0 = Off, 20 = 100% Dark (Ultra)
-MENU_LEVELS = {
+MENU_LEVELS = MappingProxyType({
     0: "Off (0%)",
     4: "Light (20%)",
     8: "Medium (40%)",
     12: "Dark (60%)",
     16: "Very Dark (80%)",
     20: "Ultra (100%)"
+})
+
+# Tray menu labels for MENU_LEVELS, with the emoji for each step
+MENU_LEVEL_LABELS = {
+    0: f"☀️  {MENU_LEVELS[0]}",
+    4: f"🌤️  {MENU_LEVELS[4]}",
+    8: f"⛅  {MENU_LEVELS[8]}",
+    12: f"🌥️  {MENU_LEVELS[12]}",
+    16: f"🌙  {MENU_LEVELS[16]}",
+    20: f"🌑  {MENU_LEVELS[20]}"
 }
 
-# Preset profiles: (dimmer_level [0-20], warm_temp [K], label, desc)
+# Menu order for MENU_LEVELS, sorted once at import
+SORTED_MENU_LEVELS = tuple(sorted(MENU_LEVELS))
+
+# Tray menu layout, built top to bottom by DimmerTray.build_menu:
+#   ("sep",)
+#   ("label", text, attr)                    insensitive, kept as self.<attr> if set
+#   ("item", text, handler, value)           activate -> self.<handler>(widget[, value])
+#   ("submenu", text, populate)              empty submenu, self.<populate> fills it
+#   ("check", text, handler, attr, state)    check item starting at self.<state>
+MENU_SCHEMA = (
+    ("label", "🔆 Dimmer Control", None),
+    ("sep",),
+    # Quick brightness presets (from MENU_LEVELS)
+    *(("item", MENU_LEVEL_LABELS[level], "on_level_activate", level)
+      for level in SORTED_MENU_LEVELS),
+    ("sep",),
+    ("submenu", "🔥 Warm Filter", "_populate_warm_once"),
+    ("sep",),
+    ("submenu", "📋 Profiles", "_populate_profiles_once"),
+    ("sep",),
+    ("item", "🎚️  Open Slider...", "on_open_slider", None),
+    ("sep",),
+    ("check", "⏰ Break Reminder (20 min)", "toggle_break_reminder", "break_menu_item", "break_enabled"),
+    ("sep",),
+    # Current dimmer / warm status
+    ("label", "Status: Off", "status_item"),
+    ("label", "Warm: Off", "warm_status_item"),
+    ("sep",),
+    ("item", "❌  Quit", "on_quit", None),
+)
+
+# Warm filter presets for the tray submenu: (temp [K], label)
+WARM_PRESETS = (
+    (6500, "❄️  Off (6500K)"),
+    (5500, "🌡️  Warm 1 (5500K)"),
+    (4500, "🌡️  Warm 2 (4500K)"),
+    (3500, "🔥  Warm 3 (3500K)"),
+    (2700, "🔥  Warm 4 (2700K)"),
+    (2000, "🕯️  Candle (2000K)")
+)
+
+
+def _level_entry(level):
+    """Build the (pct, name, status label, tooltip) entry for one level."""
+    pct = level * 5
+    if level == 0:
+        return pct, "Off", "Status: Off", "Dimmer Off"
+    # Named menu levels keep their name, the rest show the raw percentage
+    name = MENU_LEVELS.get(level, f"{pct}% Dimmed")
+    return pct, name, f"Status: {name}", f"Dimmer {pct}%"
+
+
+# Display strings for every dimmer level, indexed by level (0-20)
+_LEVEL_TABLE = tuple(_level_entry(level) for level in range(21))
+
+
+class Profile(NamedTuple):
+    """A preset combination of dimmer level and warm temperature."""
+    dim_level: int  # 0-20
+    warm_temp: int  # Kelvin
+    label: str
+    desc: str
+
+
+# Preset profiles: Profile(dimmer_level [0-20], warm_temp [K], label, desc)
 # Note: dimmer_level 0 = Off (100% bright), 20 = 100% dim (Black)
 # User request: "bright 90%" means 10% dim -> Level 2
 # Wait, let's clarify. Usually "brightness 90%" means 10% dimmed.
@@ -66,31 +184,127 @@ MENU_LEVELS = {
 # Editing: 100% Bright -> 0% Dim -> Level 0
 # Reading: 85% Bright -> 15% Dim -> Level 3
 #
-PROFILES = {
-    "health": (2, 5000, "💚 Health", "5000K, 90% Brightness"),
-    "game": (2, 6500, "🎮 Game", "6500K, 90% Brightness"),
-    "movie": (2, 6000, "🎬 Movie", "6000K, 90% Brightness"),
-    "office": (3, 5500, "💼 Office", "5500K, 85% Brightness"),
-    "editing": (0, 6500, "🖊️ Editing", "6500K, 100% Brightness"),
-    "reading": (3, 5500, "📖 Reading", "5500K, 85% Brightness"),
-}
+PROFILES = MappingProxyType({
+    "health": Profile(2, 5000, "💚 Health", "5000K, 90% Brightness"),
+    "game": Profile(2, 6500, "🎮 Game", "6500K, 90% Brightness"),
+    "movie": Profile(2, 6000, "🎬 Movie", "6000K, 90% Brightness"),
+    "office": Profile(3, 5500, "💼 Office", "5500K, 85% Brightness"),
+    "editing": Profile(0, 6500, "🖊️ Editing", "6500K, 100% Brightness"),
+    "reading": Profile(3, 5500, "📖 Reading", "5500K, 85% Brightness"),
+})
+
+# Preset buttons on the slider's Display page
+# Format: (Label, ProfileID)
+# "Pause" -> Dim 0 (100%), Warm 6500 (Off)
+# "Custom" -> Placeholder
+SLIDER_PRESETS = (
+    ("Pause", "pause"),   # Special: Off/Off
+    ("Health", "health"),
+    ("Game", "game"),
+    ("Movie", "movie"),
+    ("Office", "office"),
+    ("Editing", "editing"),
+    ("Reading", "reading"),
+    ("Custom", "custom"),
+)
 
 # Break reminder interval (in minutes)
 BREAK_INTERVAL_MINUTES = 20
 
+# Slider changes are coalesced and applied at most once per frame (~60 Hz)
+SLIDER_DEBOUNCE_MS = 16
+# Warm changes go through a qdbus process, so they are batched more coarsely
+WARM_DEBOUNCE_MS = 80
+
+# Settings changes are batched into one config write after this delay
+CONFIG_SAVE_DELAY_MS = 500
+
+
+def _config_int(value):
+    """Return a saved number as an int, or 0 for a missing or bad value."""
+    if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+        return 0
+    try:
+        return int(float(value))
+    except (ValueError, OverflowError):
+        return 0
+
+
+def _config_level(value):
+    """Saved dimmer level, clamped to 0-20."""
+    return max(0, min(20, _config_int(value)))
+
+
+def _config_warm(value):
+    """Saved warm temperature: 0 (off) or snapped into WARM_MIN-WARM_MAX."""
+    temp = _config_int(value)
+    if temp <= 0:
+        return 0
+    # Older versions saved any Kelvin value; snap it so presets still match
+    temp = (temp + WARM_SNAP // 2) // WARM_SNAP * WARM_SNAP
+    return max(WARM_MIN, min(WARM_MAX, temp))
+
 
 class DimmerTray:
     """System tray application for dimmer control."""
     
+    # Fixed attribute set; the *_item menu entries are assigned from MENU_SCHEMA
+    __slots__ = (
+        'current_level', 'warm_level', 'slider_window', 'dimmer_proc', 'notify_enabled',
+        '_notifications', '_break_notification',
+        'break_enabled', 'break_timer_id', 'break_deadline',
+        '_night_light', '_night_light_gen', '_qdbus_proc', '_config_cache', '_flush_source_id',
+        '_pending_status', '_status_idle_id',
+        'indicator', 'menu', 'status_item', 'warm_status_item', 'break_menu_item',
+        '_warm_built', '_profiles_built',
+    )
+    
     def __init__(self):
+        load_tray_modules()
+        
         self.current_level = 0  # 0 = off, 1-5 = dimmer levels
         self.warm_level = 0     # 0 = off, 1-5 = warm filter levels
         self.slider_window = None
+        self.dimmer_proc = None  # Persistent overlay daemon, fed levels over stdin
         self.notify_enabled = True  # Show notifications for hotkey changes
         
+        # Notifications are created once per title and re-shown via update()
+        self._notifications = {}
+        self._break_notification = None
+        
         # Break reminder
         self.break_enabled = False
         self.break_timer_id = None
+        self.break_deadline = None  # time.monotonic() of the next reminder
+        
+        # Long-lived proxy for KWin Night Light; qdbus is only a fallback
+        self._night_light = None
+        # Bumped per call so a late completion for an older value is ignored
+        self._night_light_gen = 0
+        self._qdbus_proc = None  # Running qdbus fallback, if any
+        try:
+            self._night_light = Gio.DBusProxy.new_for_bus_sync(
+                Gio.BusType.SESSION,
+                Gio.DBusProxyFlags.DO_NOT_LOAD_PROPERTIES
+                | Gio.DBusProxyFlags.DO_NOT_CONNECT_SIGNALS,
+                None, *NIGHT_LIGHT_DBUS, None
+            )
+        except GLib.Error as e:
+            log.warning("Night Light D-Bus proxy unavailable, using qdbus: %s", e.message)
+        
+        # Last settings read from / written to disk, used to skip no-op saves
+        self._config_cache = {'level': 0, 'warm': 0, 'break_enabled': False}
+        self._flush_source_id = None  # Pending delayed save_config
+        
+        # Menu status labels waiting for the idle flush, keyed by item
+        self._pending_status = {}
+        self._status_idle_id = None
+        
+        # Create the config directory once here rather than on every save
+        try:
+            os.makedirs(CONFIG_DIR, exist_ok=True)
+        except OSError as e:
+            log.warning("Failed to create config directory: %s", e)
         
         # Load saved settings from config
         saved_level, saved_warm, saved_break = self.load_config()
@@ -110,54 +324,101 @@ class DimmerTray:
         
         # Apply saved settings (after menu is built so status_item exists)
         if saved_level > 0:
-            print(f"[INFO] Restoring saved dimmer level: {saved_level}")
-            GLib.idle_add(lambda: self.set_dimmer_level(saved_level, notify=False))
+            log.info("Restoring saved dimmer level: %s", saved_level)
+            self.set_dimmer_level(saved_level, notify=False)
         if saved_warm > 0:
-            print(f"[INFO] Restoring saved warm level: {saved_warm}")
-            GLib.idle_add(lambda: self.set_warm_level(saved_warm, notify=False))
+            log.info("Restoring saved warm level: %s", saved_warm)
+            self.set_warm_level(saved_warm, notify=False)
         
         # Start break reminder if enabled
         if self.break_enabled:
             self.start_break_timer()
+        
+        # Build the slider window while idle so the first open is instant
+        GLib.idle_add(self._prewarm_slider)
+    
+    def _prewarm_slider(self):
+        """Construct the (hidden) slider window ahead of the first open."""
+        if self.slider_window is None:
+            self.slider_window = SliderWindow(self)
+        return False
     
     def load_config(self):
         """Load configuration from file."""
         try:
-            if os.path.exists(CONFIG_FILE):
-                with open(CONFIG_FILE, 'r') as f:
-                    config = json.load(f)
-                    return (
-                        config.get('level', 0),
-                        config.get('warm', 0),
-                        config.get('break_enabled', False)
-                    )
+            with open(CONFIG_FILE, 'rb') as f:
+                config = _loads(f.read())
+                self._config_cache = {
+                    'level': _config_level(config.get('level')),
+                    'warm': _config_warm(config.get('warm')),
+                    'break_enabled': config.get('break_enabled') is True
+                }
+        except FileNotFoundError:
+            pass  # First run, keep the defaults
         except Exception as e:
-            print(f"[WARN] Failed to load config: {e}")
-        return 0, 0, False
+            log.warning("Failed to load config: %s", e)
+        cache = self._config_cache
+        return cache['level'], cache['warm'], cache['break_enabled']
     
     def save_config(self):
-        """Save current settings to config file."""
+        """Save current settings to config file if they changed."""
+        config = {
+            'level': self.current_level,
+            'warm': self.warm_level,
+            'break_enabled': self.break_enabled
+        }
+        if config == self._config_cache:
+            return
         try:
-            os.makedirs(CONFIG_DIR, exist_ok=True)
-            with open(CONFIG_FILE, 'w') as f:
-                json.dump({
-                    'level': self.current_level,
-                    'warm': self.warm_level,
-                    'break_enabled': self.break_enabled
-                }, f)
+            # Write a sibling temp file and rename it so the config is never torn
+            tmp_file = CONFIG_FILE + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.write(_dumps(config))
+            os.replace(tmp_file, CONFIG_FILE)
+            self._config_cache = config
         except Exception as e:
-            print(f"[WARN] Failed to save config: {e}")
+            log.warning("Failed to save config: %s", e)
+    
+    def _schedule_flush(self):
+        """Save the config once changes stop arriving for a moment."""
+        if self._flush_source_id is None:
+            self._flush_source_id = GLib.timeout_add(CONFIG_SAVE_DELAY_MS, self._do_flush)
+    
+    def _do_flush(self):
+        """Timer callback for _schedule_flush."""
+        self._flush_source_id = None
+        self.save_config()
+        return False
+    
+    def _queue_status(self, item, text):
+        """Set a status label on idle so a burst of changes relabels once."""
+        self._pending_status[item] = text
+        if self._status_idle_id is None:
+            self._status_idle_id = GLib.idle_add(self._flush_status)
+    
+    def _flush_status(self):
+        """Idle callback for _queue_status."""
+        self._status_idle_id = None
+        for item, text in self._pending_status.items():
+            item.set_label(text)
+        self._pending_status.clear()
+        return False
     
     def show_notification(self, title, message, icon="display-brightness-symbolic"):
         """Show a desktop notification."""
         if not self.notify_enabled:
             return
         try:
-            notification = Notify.Notification.new(title, message, icon)
-            notification.set_timeout(1500)  # 1.5 seconds
+            notification = self._notifications.get(title)
+            if notification is None:
+                notification = Notify.Notification.new(title, message, icon)
+                notification.set_timeout(1500)  # 1.5 seconds
+                self._notifications[title] = notification
+            else:
+                notification.update(title, message, icon)
             notification.show()
         except Exception as e:
-            print(f"[WARN] Notification failed: {e}")
+            log.warning("Notification failed: %s", e)
     
     # ========== BREAK REMINDER ==========
     def start_break_timer(self):
@@ -165,29 +426,36 @@ class DimmerTray:
         if self.break_timer_id:
             GLib.source_remove(self.break_timer_id)
         
-        interval_ms = BREAK_INTERVAL_MINUTES * 60 * 1000
-        self.break_timer_id = GLib.timeout_add(interval_ms, self.on_break_reminder)
-        print(f"[INFO] Break reminder started ({BREAK_INTERVAL_MINUTES} min interval)")
+        # Second-granularity source lets GLib coalesce wakeups with other timers
+        self.break_timer_id = GLib.timeout_add_seconds(
+            BREAK_INTERVAL_MINUTES * 60, self.on_break_reminder
+        )
+        self.break_deadline = time.monotonic() + BREAK_INTERVAL_MINUTES * 60
+        log.info("Break reminder started (%s min interval)", BREAK_INTERVAL_MINUTES)
     
     def stop_break_timer(self):
         """Stop the break reminder timer."""
         if self.break_timer_id:
             GLib.source_remove(self.break_timer_id)
             self.break_timer_id = None
-        print("[INFO] Break reminder stopped")
+        self.break_deadline = None
+        log.info("Break reminder stopped")
     
     def on_break_reminder(self):
         """Called when break reminder triggers."""
-        # Show notification
-        notification = Notify.Notification.new(
-            "👀 Eye Break Reminder",
-            "Time to rest your eyes!\nLook at something 20 feet (6m) away for 20 seconds.",
-            "dialog-information"
-        )
-        notification.set_timeout(10000)  # 10 seconds
-        notification.set_urgency(2)  # Critical
-        notification.show()
-        print("[INFO] Break reminder notification shown")
+        # Show notification (content never changes, so build it only once)
+        if self._break_notification is None:
+            notification = Notify.Notification.new(
+                "👀 Eye Break Reminder",
+                "Time to rest your eyes!\nLook at something 20 feet (6m) away for 20 seconds.",
+                "dialog-information"
+            )
+            notification.set_timeout(10000)  # 10 seconds
+            notification.set_urgency(2)  # Critical
+            self._break_notification = notification
+        self._break_notification.show()
+        self.break_deadline = time.monotonic() + BREAK_INTERVAL_MINUTES * 60
+        log.info("Break reminder notification shown")
         return True  # Return True to keep timer running
     
     def toggle_break_reminder(self, widget):
@@ -204,7 +472,9 @@ class DimmerTray:
             self.stop_break_timer()
             self.show_notification("⏰ Break Reminder", "Disabled")
         
-        self.save_config()
+        if self.slider_window is not None:
+            self.slider_window.resume_timer_tick()
+        self._schedule_flush()
     
     # ========== PROFILES ==========
     def apply_profile(self, profile_name):
@@ -212,213 +482,185 @@ class DimmerTray:
         if profile_name not in PROFILES:
             return
         
-        # New format: dim_level, warm_temp, label, desc
-        dim_level, warm_temp, label, desc = PROFILES[profile_name]
-        self.set_dimmer_level(dim_level, notify=False)
-        self.set_warm_level(warm_temp, notify=False)
-        self.show_notification(f"{label} Profile", desc)
+        profile = PROFILES[profile_name]
+        self.apply_settings(profile.dim_level, profile.warm_temp)
+        self.show_notification(f"{profile.label} Profile", profile.desc)
+    
+    def apply_settings(self, level, temp):
+        """Set dimmer level and warm temperature together, without notifying."""
+        # The overlay daemon and Night Light are separate backends, so this is
+        # still one write to each; unchanged halves are skipped by the setters
+        self.set_dimmer_level(level)
+        self.set_warm_level(temp)
         
     def build_menu(self):
-        """Build the system tray context menu."""
+        """Build the system tray context menu from MENU_SCHEMA."""
         self.menu = Gtk.Menu()
-        
-        # Header
-        header = Gtk.MenuItem(label="🔆 Dimmer Control")
-        header.set_sensitive(False)
-        self.menu.append(header)
-        
-        self.menu.append(Gtk.SeparatorMenuItem())
-        
-        # Quick brightness presets (from MENU_LEVELS)
-        # Sort levels to ensure order
-        sorted_levels = sorted(MENU_LEVELS.keys())
-        
-        for level in sorted_levels:
-            name = MENU_LEVELS[level]
-            # Add emoji if missing (simple heuristic)
-            if "Off" in name:
-                label = f"☀️  {name}"
-            elif "20%" in name:
-                label = f"🌤️  {name}"
-            elif "40%" in name:
-                label = f"⛅  {name}"
-            elif "60%" in name:
-                label = f"🌥️  {name}"
-            elif "80%" in name:
-                label = f"🌙  {name}"
-            elif "100%" in name:
-                label = f"🌑  {name}"
-            else:
-                label = name
-                
-            item = Gtk.MenuItem(label=label)
-            # Use default arg to capture loop variable
-            item.connect("activate", lambda w, l=level: self.set_dimmer_level(l))
+        # Submenus are filled in the first time they are opened
+        self._warm_built = False
+        self._profiles_built = False
+        
+        for kind, *spec in MENU_SCHEMA:
+            if kind == "sep":
+                item = Gtk.SeparatorMenuItem()
+            elif kind == "label":
+                label, attr = spec
+                item = Gtk.MenuItem(label=label)
+                item.set_sensitive(False)
+                if attr:
+                    setattr(self, attr, item)
+            elif kind == "item":
+                label, handler, value = spec
+                item = Gtk.MenuItem(label=label)
+                if value is None:
+                    item.connect("activate", getattr(self, handler))
+                else:
+                    item.connect("activate", getattr(self, handler), value)
+            elif kind == "submenu":
+                label, populate = spec
+                item = Gtk.MenuItem(label=label)
+                item.set_submenu(Gtk.Menu())
+                item.connect("activate", getattr(self, populate))
+            elif kind == "check":
+                label, handler, attr, state = spec
+                item = Gtk.CheckMenuItem(label=label)
+                # Set before connecting so the initial state doesn't fire the handler
+                item.set_active(getattr(self, state))
+                item.connect("toggled", getattr(self, handler))
+                setattr(self, attr, item)
             self.menu.append(item)
         
-        self.menu.append(Gtk.SeparatorMenuItem())
-        
-        # Warm filter submenu
-        warm_menu_item = Gtk.MenuItem(label="🔥 Warm Filter")
-        warm_submenu = Gtk.Menu()
-        
-        # Define warm presets for menu
-        warm_presets = [
-            (6500, "❄️  Off (6500K)"),
-            (5500, "🌡️  Warm 1 (5500K)"),
-            (4500, "🌡️  Warm 2 (4500K)"),
-            (3500, "🔥  Warm 3 (3500K)"),
-            (2700, "🔥  Warm 4 (2700K)"),
-            (2000, "🕯️  Candle (2000K)")
-        ]
+        self.menu.show_all()
+        self.indicator.set_menu(self.menu)
+    
+    def _populate_warm_once(self, menu_item):
+        """Create the warm filter submenu items on first open."""
+        if self._warm_built:
+            return
+        self._warm_built = True
         
-        for temp, label in warm_presets:
+        warm_submenu = menu_item.get_submenu()
+        for temp, label in WARM_PRESETS:
             item = Gtk.MenuItem(label=label)
-            item.connect("activate", lambda w, t=temp: self.set_warm_level(t))
+            item.connect("activate", self.on_warm_activate, temp)
             warm_submenu.append(item)
+        warm_submenu.show_all()
+    
+    def _populate_profiles_once(self, menu_item):
+        """Create the profiles submenu items on first open."""
+        if self._profiles_built:
+            return
+        self._profiles_built = True
         
-        warm_menu_item.set_submenu(warm_submenu)
-        self.menu.append(warm_menu_item)
-        
-        self.menu.append(Gtk.SeparatorMenuItem())
-        
-        # Profiles submenu
-        profiles_menu_item = Gtk.MenuItem(label="📋 Profiles")
-        profiles_submenu = Gtk.Menu()
-        
-        for profile_id, profile_data in PROFILES.items():
-            _, _, label, desc = profile_data
-            item = Gtk.MenuItem(label=f"{label}")
-            item.connect("activate", lambda w, p=profile_id: self.apply_profile(p))
+        profiles_submenu = menu_item.get_submenu()
+        for profile_id, profile in PROFILES.items():
+            item = Gtk.MenuItem(label=profile.label)
+            item.connect("activate", self.on_profile_activate, profile_id)
             profiles_submenu.append(item)
-        
-        profiles_menu_item.set_submenu(profiles_submenu)
-        self.menu.append(profiles_menu_item)
-        
-        self.menu.append(Gtk.SeparatorMenuItem())
-        
-        # Slider window option
-        slider_item = Gtk.MenuItem(label="🎚️  Open Slider...")
-        slider_item.connect("activate", self.on_open_slider)
-        self.menu.append(slider_item)
-        
-        self.menu.append(Gtk.SeparatorMenuItem())
-        
-        # Break reminder toggle
-        self.break_menu_item = Gtk.CheckMenuItem(label="⏰ Break Reminder (20 min)")
-        self.break_menu_item.set_active(self.break_enabled)
-        self.break_menu_item.connect("toggled", self.toggle_break_reminder)
-        self.menu.append(self.break_menu_item)
-        
-        self.menu.append(Gtk.SeparatorMenuItem())
-        
-        # Current status
-        self.status_item = Gtk.MenuItem(label="Status: Off")
-        self.status_item.set_sensitive(False)
-        self.menu.append(self.status_item)
-        
-        # Warm status
-        self.warm_status_item = Gtk.MenuItem(label="Warm: Off")
-        self.warm_status_item.set_sensitive(False)
-        self.menu.append(self.warm_status_item)
-        
-        self.menu.append(Gtk.SeparatorMenuItem())
-        
-        # Quit option
-        quit_item = Gtk.MenuItem(label="❌  Quit")
-        quit_item.connect("activate", self.on_quit)
-        self.menu.append(quit_item)
-        
-        self.menu.show_all()
-        self.indicator.set_menu(self.menu)
+        profiles_submenu.show_all()
+    
+    # Menu items pass their value as signal user data to these shared handlers
+    def on_level_activate(self, widget, level):
+        self.set_dimmer_level(level)
+    
+    def on_warm_activate(self, widget, temp):
+        self.set_warm_level(temp)
+    
+    def on_profile_activate(self, widget, profile_id):
+        self.apply_profile(profile_id)
     
     def set_dimmer_level(self, level, notify=False):
         """Set the dimmer to specified level (0-20)."""
-        print(f"[DEBUG] Setting dimmer level to {level}")
-        
-        # Kill any existing dimmer process
-        try:
-            subprocess.run(['pkill', '-f', 'dimmer_passthrough'],
-                          stderr=subprocess.DEVNULL, timeout=2)
-        except subprocess.TimeoutExpired:
-            pass
+        log.debug("Setting dimmer level to %s", level)
         
         # Clamp level
         level = max(0, min(20, int(level)))
+        # Nothing to do if already there (a notify request still shows the popup),
+        # unless the daemon died and the overlay needs restoring
+        if level == self.current_level and not notify and (
+                level == 0 or (self.dimmer_proc is not None and self.dimmer_proc.poll() is None)):
+            return
+        
+        # Hand the level to the running daemon instead of respawning it
+        if not self.send_dimmer_level(level):
+            return
         self.current_level = level
         
+        pct, level_name, status_label, tooltip = _LEVEL_TABLE[level]
+        self._queue_status(self.status_item, status_label)
+        # Always use custom eye icon, desc only changes
+        self.indicator.set_icon_full(ICON_PATH, tooltip)
+        
         if level == 0:
-            self.status_item.set_label("Status: Off")
-            # Always use custom eye icon
-            self.indicator.set_icon_full(ICON_PATH, "Dimmer Off")
-            print("[DEBUG] Dimmer turned off")
+            log.debug("Dimmer turned off")
             if notify:
                 self.show_notification("🔆 Dimmer", "Off - Full brightness")
         else:
-            pct = level * 5
-            # find closest menu name
-            level_name = f"{pct}% Dimmed"
-            if level in MENU_LEVELS:
-                level_name = MENU_LEVELS[level]
-                
-            self.status_item.set_label(f"Status: {level_name}")
-            
-            # Start the dimmer process
+            log.debug("Dimmer set to level %s (%s%%)", level, pct)
+            if notify:
+                self.show_notification("🌙 Dimmer", level_name)
+        
+        # Save level to config
+        self._schedule_flush()
+    
+    def send_dimmer_level(self, level):
+        """Write a level to the overlay daemon, starting it on first use."""
+        if self.dimmer_proc is None or self.dimmer_proc.poll() is not None:
+            if level == 0:
+                # Nothing is running, so the screen is already undimmed
+                return True
             try:
-                proc = subprocess.Popen(
-                    [DIMMER_BINARY, str(level)],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
+                self.dimmer_proc = subprocess.Popen(
+                    [DIMMER_BINARY, '--stdin'],
+                    stdin=subprocess.PIPE,
+                    stdout=DEVNULL_FD,
+                    stderr=DEVNULL_FD,
+                    bufsize=0,
                     start_new_session=True
                 )
-                print(f"[DEBUG] Started dimmer with PID {proc.pid}, level {level} ({pct}%)")
+                log.debug("Started dimmer daemon with PID %s", self.dimmer_proc.pid)
             except Exception as e:
-                print(f"[ERROR] Failed to start dimmer: {e}")
-                return
-            
-            # Use custom eye icon, desc only changes
-            self.indicator.set_icon_full(ICON_PATH, f"Dimmer {pct}%")
-            
-            if notify:
-                self.show_notification("🌙 Dimmer", level_name)
+                log.error("Failed to start dimmer: %s", e)
+                return False
         
-        # Save level to config
-        self.save_config()
+        try:
+            self.dimmer_proc.stdin.write(f"{level}\n".encode())
+        except OSError as e:
+            log.error("Failed to update dimmer: %s", e)
+            return False
+        return True
     
     def set_warm_level(self, temp, notify=False):
         """Set the warm filter temperature (Kelvin)."""
-        print(f"[DEBUG] Setting warm temperature to {temp}K")
+        log.debug("Setting warm temperature to %sK", temp)
         
-        self.warm_level = int(temp)
+        temp = int(temp)
+        if temp == self.warm_level and not notify:
+            return
+        self.warm_level = temp
         
-        # Use KDE Night Light via qdbus
+        # Use KDE Night Light via D-Bus
         try:
             # 6500K is standard daylight/off. 0 also means off.
             if temp == 0 or temp >= 6500:
                 # Stop preview (return to normal/scheduled mode)
-                subprocess.run([
-                    'qdbus', 'org.kde.KWin', '/org/kde/KWin/NightLight',
-                    'org.kde.KWin.NightLight.stopPreview'
-                ], stderr=subprocess.DEVNULL, timeout=5)
-                print("[DEBUG] Stopped Night Light preview")
+                self.call_night_light('stopPreview')
+                log.debug("Stopped Night Light preview")
                 status_text = "Off (6500K)"
                 notif_text = "Off - Neutral colors"
             else:
                 # Preview the temperature
-                subprocess.run([
-                    'qdbus', 'org.kde.KWin', '/org/kde/KWin/NightLight',
-                    'org.kde.KWin.NightLight.preview', str(temp)
-                ], stderr=subprocess.DEVNULL, timeout=5)
-                print(f"[DEBUG] Applied Night Light temperature: {temp}K")
+                self.call_night_light('preview', int(temp))
+                log.debug("Applied Night Light temperature: %sK", temp)
                 status_text = f"{temp}K"
                 notif_text = f"Temperature: {temp}K"
                 
         except Exception as e:
-            print(f"[ERROR] Failed to set warm filter: {e}")
+            log.error("Failed to set warm filter: %s", e)
             return
         
         # Update status item
-        self.warm_status_item.set_label(f"Warm: {status_text}")
+        self._queue_status(self.warm_status_item, f"Warm: {status_text}")
         
         if notify:
             if temp == 0 or temp >= 6500:
@@ -427,28 +669,92 @@ class DimmerTray:
                 self.show_notification("🔥 Warm Filter", notif_text)
         
         # Save config
-        self.save_config()
+        self._schedule_flush()
+    
+    def call_night_light(self, method, *args):
+        """Call a KWin Night Light method (uint args) asynchronously, falling back to qdbus."""
+        self._night_light_gen += 1
+        if self._night_light is not None:
+            params = GLib.Variant('(' + 'u' * len(args) + ')', args) if args else None
+            self._night_light.call(
+                method, params, Gio.DBusCallFlags.NONE, 5000, None,
+                self._on_night_light_done, (self._night_light_gen, method, args)
+            )
+        else:
+            self.run_qdbus(method, args)
+    
+    def _on_night_light_done(self, proxy, result, call):
+        gen, method, args = call
+        try:
+            proxy.call_finish(result)
+        except GLib.Error as e:
+            # A newer value has been sent since; retrying this one would undo it
+            if gen != self._night_light_gen:
+                return
+            log.debug("Night Light D-Bus call failed, trying qdbus: %s", e.message)
+            self.run_qdbus(method, args)
+    
+    def run_qdbus(self, method, args):
+        """Run the qdbus fallback for a Night Light call asynchronously."""
+        service, path, interface = NIGHT_LIGHT_DBUS
+        # Only the newest value matters; stop an older qdbus so it cannot land last
+        if self._qdbus_proc is not None:
+            self._qdbus_proc.force_exit()
+            self._qdbus_proc = None
+        try:
+            proc = Gio.Subprocess.new(
+                ['qdbus', service, path, f'{interface}.{method}', *map(str, args)],
+                Gio.SubprocessFlags.STDERR_SILENCE
+            )
+        except GLib.Error as e:
+            log.error("Failed to set warm filter: %s", e.message)
+            return
+        self._qdbus_proc = proc
+        proc.wait_check_async(None, self._on_qdbus_done, method)
+    
+    def _on_qdbus_done(self, proc, result, method):
+        stale = proc is not self._qdbus_proc
+        if not stale:
+            self._qdbus_proc = None
+        try:
+            proc.wait_check_finish(result)
+        except GLib.Error as e:
+            # A superseded call was killed on purpose
+            if not stale:
+                log.error("qdbus %s failed: %s", method, e.message)
     
     def on_open_slider(self, widget):
         """Open the slider control window."""
-        print("[DEBUG] Opening slider window")
-        if self.slider_window is not None:
-            self.slider_window.present()
-            return
+        log.debug("Opening slider window")
+        if self.slider_window is None:
+            self.slider_window = SliderWindow(self)
         
-        self.slider_window = SliderWindow(self)
+        # Levels may have changed from the tray menu while the window was hidden
+        self.slider_window.sync_from_tray()
+        # A prewarmed window has never been shown, so its children need show_all
         self.slider_window.show_all()
-    
-    def on_slider_closed(self):
-        """Called when slider window is closed."""
-        self.slider_window = None
+        self.slider_window.present()
     
     def on_quit(self, widget):
         """Handle quit action."""
-        print("[DEBUG] Quitting...")
-        # Kill any dimmer process
-        subprocess.run(['pkill', '-f', 'dimmer_passthrough'],
-                      stderr=subprocess.DEVNULL)
+        log.debug("Quitting...")
+        # Write out any settings still waiting on the save timer
+        if self._flush_source_id is not None:
+            GLib.source_remove(self._flush_source_id)
+            self._flush_source_id = None
+        self.save_config()
+        # Close the pipe and SIGTERM the daemon's session without waiting; the
+        # X server drops the overlay window when the daemon's connection closes
+        proc = self.dimmer_proc
+        if proc is not None and proc.poll() is None:
+            try:
+                proc.stdin.close()
+            except OSError:
+                pass
+            try:
+                os.killpg(proc.pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
         Gtk.main_quit()
     
     def run(self):
@@ -458,6 +764,206 @@ class DimmerTray:
         Gtk.main()
 
 
+# Slider window stylesheet, parsed and installed when the slider is first built
+_CSS = b"""
+    /* Main Window */
+    window { background-color: #ffffff; }
+    .sidebar { background-color: #008080; color: white; }
+    .content-area { background-color: #ffffff; }
+    
+    /* Sidebar Buttons - Match CareUEyes style */
+    .nav-button {
+        background-image: none;
+        background-color: transparent;
+        color: white;
+        border: none;
+        border-radius: 0;
+        padding: 15px 20px;
+        font-weight: 600;
+        font-size: 14px;
+        text-shadow: none;
+        box-shadow: none;
+        -gtk-icon-shadow: none;
+    }
+    .nav-button label {
+        color: white;
+    }
+    .nav-button image {
+        color: white;
+        -gtk-icon-style: symbolic;
+    }
+    .nav-button:checked {
+        background-image: none;
+        background-color: #ffffff;
+        color: #009688;
+        border-radius: 0;
+    }
+    .nav-button:checked label {
+        color: #009688;
+    }
+    .nav-button:checked image {
+        color: #009688;
+        -gtk-icon-style: symbolic;
+    }
+    .nav-button:hover:not(:checked) {
+        background-color: #00695c;
+    }
+    
+    /* Sliders */
+    .thick-slider trough {
+        min-height: 8px;
+        border-radius: 4px;
+        background-color: #e0e0e0;
+    }
+    .thick-slider highlight {
+        min-height: 8px;
+        border-radius: 4px;
+        background-color: #009688; /* Teal */
+    }
+    .thick-slider slider {
+        min-width: 24px; min-height: 24px;
+        border-radius: 50%;
+        background-color: #ffffff;
+        border: 2px solid #009688;
+        box-shadow: 0 2px 4px rgba(0,0,0,0.2);
+    }
+    
+    /* Presets */
+    .preset-btn {
+        background-image: none;
+        background-color: #e0f2f1;
+        color: #00695c;
+        border: none;
+        border-radius: 4px;
+        box-shadow: none;
+    }
+    .preset-btn:hover { background-color: #b2dfdb; }
+    .preset-active { 
+        background-color: #009688; 
+        color: white; 
+    }
+    
+    /* Timer Page */
+    .timer-container {
+        background-color: #009688;
+        color: white;
+    }
+    .timer-digits {
+        font-size: 64px;
+        font-weight: bold;
+        color: white;
+    }
+    .timer-sublabel { font-size: 16px; color: #b2dfdb; }
+    
+    .orange-btn {
+        background-color: #ff9800;
+        color: white;
+        font-weight: bold;
+        border-radius: 20px;
+        border: none;
+    }
+    .orange-btn:hover { background-color: #f57c00; }
+    
+    .value-tag {
+        background-color: #009688;
+        color: white;
+        border-radius: 4px;
+        padding: 2px 6px;
+        font-size: 11px;
+    }
+    .grey-text { color: #888888; }
+    .flat-button { border: none; background: transparent; }
+"""
+
+# DIMMER_FAST_CSS=1 drops rounded corners, shadows and transitions, which are
+# slow to draw with GTK's software (cairo) renderer, e.g. in VMs
+if os.environ.get("DIMMER_FAST_CSS"):
+    _CSS = re.sub(rb"\s*(border-radius|box-shadow)\s*:[^;]*;", b"", _CSS) + (
+        b"\n* { border-radius: 0; box-shadow: none; transition: none; }\n"
+    )
+
+
+def _minify_css(css):
+    """Strip comments and redundant whitespace from a stylesheet."""
+    css = re.sub(rb"/\*.*?\*/", b"", css, flags=re.S)
+    css = re.sub(rb"\s+", b" ", css)
+    # Not around ':' since whitespace there can be a selector combinator
+    return re.sub(rb" ?([{};,]) ?", rb"\1", css).strip()
+
+
+# The readable source above stays for editing; GTK only tokenizes this
+_CSS = _minify_css(_CSS)
+
+_css_installed = False
+
+
+def _install_css_once():
+    """Parse the slider stylesheet and install it on the default screen (once)."""
+    global _css_installed
+    if _css_installed:
+        return
+    # Runs once per process, from the idle slider prewarm after startup
+    provider = Gtk.CssProvider()
+    provider.load_from_data(_CSS)
+    Gtk.StyleContext.add_provider_for_screen(
+        Gdk.Screen.get_default(), provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+    )
+    _css_installed = True
+
+
+# Slider <-> setting mapping. Brightness slider: 100 - level * LEVEL_STEP.
+# Warm slider: 0 (More Warm) = WARM_MIN .. 100 (Less Warm) = WARM_MAX.
+LEVEL_STEP = 5
+WARM_MIN = 2000
+WARM_MAX = 6500
+WARM_SLOPE = (WARM_MAX - WARM_MIN) // 100  # Kelvin per slider step
+WARM_SNAP = 100  # Applied temperatures are rounded to this many Kelvin
+
+
+def _slider_to_level(value):
+    return (100 - int(value)) // LEVEL_STEP
+
+
+def _level_to_slider(level):
+    return 100 - level * LEVEL_STEP
+
+
+# Integer-only warm conversions, rounding half up to the WARM_SNAP grid.
+# Every grid temperature survives temp -> slider -> temp unchanged.
+def _slider_to_temp(value):
+    return WARM_MIN + ((int(value) * WARM_SLOPE + WARM_SNAP // 2) // WARM_SNAP) * WARM_SNAP
+
+
+def _temp_to_slider(temp):
+    return max(0, min(100, (temp - WARM_MIN) // WARM_SLOPE))
+
+
+# Pre-formatted scale and value-label strings: every brightness % and snapped temperature
+_DIM_FMT = tuple(f"{pct}%" for pct in range(101))
+_WARM_FMT = {temp: f"{temp}K" for temp in range(WARM_MIN, WARM_MAX + 1, WARM_SNAP)}
+
+
+def _warm_text(temp):
+    return _WARM_FMT.get(temp) or f"{temp}K"
+
+
+# Preset id by exact (level, temp); the first profile in PROFILES order wins
+_PROFILE_INDEX = {}
+for _pid, _profile in PROFILES.items():
+    # Exact matching needs every preset on the slider's WARM_SNAP grid
+    if _profile.warm_temp % WARM_SNAP:
+        raise ValueError(f"profile {_pid!r} warm_temp is not a multiple of {WARM_SNAP}K")
+    _PROFILE_INDEX.setdefault((_profile.dim_level, _profile.warm_temp), _pid)
+del _pid, _profile
+
+
+def _match_profile(curr_d, curr_w):
+    """Return the preset id for a dimmer level and warm temperature."""
+    # Check pause
+    if curr_d == 0 and curr_w >= 6500:
+        return "pause"
+    return _PROFILE_INDEX.get((curr_d, curr_w), "custom")
+
 
 class SliderWindow(Gtk.Window):
     """Modern UI Slider window matching CareUEyes design."""
@@ -474,10 +980,29 @@ class SliderWindow(Gtk.Window):
         # Track active profile for styling
         self.current_profile_id = None
         self.preset_buttons = {}
-        self.updating_from_profile = False  # Flag to prevent slider feedback loop
+        self._preset_contexts = {}  # Style context per preset button, fetched once
+        self._active_pid = None  # Preset currently styled as preset-active
+        
+        # Latest brightness level from the slider, applied by a debounce timer
+        self._pending_level = None
+        self._dim_timer_id = 0
+        self._pending_temp = None
+        self._warm_timer_id = 0
+        # Last quantized slider outputs, to drop moves that change nothing
+        self._last_level = None
+        self._last_temp = None
+        
+        # While a slider is held, profile matching waits for the release
+        self._dragging = False
+        self._profile_stale = False
+        self._ui_idle_id = 0  # Pending _refresh_ui
+        
+        # 1 s timer label tick, only running while the break page is showing
+        self._timer_tick_src = None
+        self._last_timer_text = ""
         
         # Apply custom theme
-        self.apply_css()
+        _install_css_once()
         
         # Main layout container (Horizontal: Sidebar | Content)
         main_hbox = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=0)
@@ -560,7 +1085,8 @@ class SliderWindow(Gtk.Window):
         self.create_display_page()
         
         # --- PAGE 2: BREAK TIMER ---
-        self.create_break_page()
+        # Built by on_nav_toggled the first time the page is opened
+        self._page_builders = {"break_page": self.create_break_page}
         
         # --- PLACEHOLDER PAGE ---
         placeholder = Gtk.Label(label="Feature coming soon...")
@@ -568,9 +1094,9 @@ class SliderWindow(Gtk.Window):
         
         # Handle window close
         self.connect("delete-event", self.on_delete)
-        
-        # Update timer label
-        GLib.timeout_add(1000, self.update_timer_ui)
+        # The timer label tick only runs while the window is visible
+        self.connect("show", self.on_window_shown)
+        self.connect("hide", self.on_window_hidden)
         
         # Check initial profile state
         self.check_profile_match()
@@ -595,11 +1121,9 @@ class SliderWindow(Gtk.Window):
         
         # Calculate initial slider pos from Kelvin
         # Range: 2000K (0%, Left, More Warm) -> 6500K (100%, Right, Less Warm)
-        # Value = (Temp - 2000) / (6500 - 2000) * 100
         current_k = self.tray_app.warm_level
-        if current_k == 0: current_k = 6500
-        slider_val = ((current_k - 2000) / 4500) * 100
-        slider_val = max(0, min(100, slider_val))
+        if current_k == 0: current_k = WARM_MAX
+        slider_val = _temp_to_slider(current_k)
         
         self.warm_adj = Gtk.Adjustment(value=slider_val, lower=0, upper=100, step_increment=1, page_increment=10, page_size=0)
         self.warm_scale = Gtk.Scale(orientation=Gtk.Orientation.HORIZONTAL, adjustment=self.warm_adj)
@@ -609,8 +1133,10 @@ class SliderWindow(Gtk.Window):
         # Removing inverted so fill is Left->Right
         self.warm_scale.add_mark(0, Gtk.PositionType.BOTTOM, "More Warm")
         self.warm_scale.add_mark(100, Gtk.PositionType.BOTTOM, "Less Warm")
-        self.warm_scale.connect("value-changed", self.on_warm_changed)
+        self._warm_hid = self.warm_scale.connect("value-changed", self.on_warm_changed)
         self.warm_scale.connect("format-value", self.format_warm_value)
+        self.warm_scale.connect("button-press-event", self.on_scale_pressed)
+        self.warm_scale.connect("button-release-event", self.on_scale_released)
         warm_box.pack_start(self.warm_scale, False, False, 0)
         
         page.pack_start(warm_box, False, False, 0)
@@ -619,13 +1145,13 @@ class SliderWindow(Gtk.Window):
         # 0 (Less Bright/Dark) -> 100 (More Bright)
         # App Level 0 = Bright, 20 = Dark.
         # Slider 0 = Level 20. Slider 100 = Level 0.
-        # Slider = 100 - (Level * 5)
+        # Slider = 100 - (Level * 5), see _level_to_slider
         dim_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=5)
         
         db_label = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
         db_label.pack_start(Gtk.Label(label="Brightness"), False, False, 0)
         
-        curr_pct = 100 - (self.tray_app.current_level * 5)
+        curr_pct = _level_to_slider(self.tray_app.current_level)
         self.dim_val_label = Gtk.Label(label=f"{curr_pct}%")
         self.dim_val_label.get_style_context().add_class("value-tag")
         db_label.pack_end(self.dim_val_label, False, False, 0)
@@ -638,8 +1164,10 @@ class SliderWindow(Gtk.Window):
         self.dim_scale.get_style_context().add_class("thick-slider")
         self.dim_scale.add_mark(0, Gtk.PositionType.BOTTOM, "Less Bright")
         self.dim_scale.add_mark(100, Gtk.PositionType.BOTTOM, "More Bright")
-        self.dim_scale.connect("value-changed", self.on_dimmer_changed)
+        self._dim_hid = self.dim_scale.connect("value-changed", self.on_dimmer_changed)
         self.dim_scale.connect("format-value", self.format_dim_value)
+        self.dim_scale.connect("button-press-event", self.on_scale_pressed)
+        self.dim_scale.connect("button-release-event", self.on_scale_released)
         dim_box.pack_start(self.dim_scale, False, False, 0)
         
         page.pack_start(dim_box, False, False, 0)
@@ -663,29 +1191,15 @@ class SliderWindow(Gtk.Window):
         flow.set_column_spacing(10)
         flow.set_row_spacing(10)
         
-        # Requested Profiles
-        # Format: (Label, ProfileID)
-        presets_list = [
-            ("Pause", "pause"),   # Special: Off/Off
-            ("Health", "health"),
-            ("Game", "game"),
-            ("Movie", "movie"),
-            ("Office", "office"),
-            ("Editing", "editing"),
-            ("Reading", "reading"),
-            ("Custom", "custom")
-        ]
-        
-        # "Pause" -> Dim 0 (100%), Warm 6500 (Off)
-        # "Custom" -> Placeholder
-        
-        for label, pid in presets_list:
+        for label, pid in SLIDER_PRESETS:
             btn = Gtk.Button(label=label)
-            btn.get_style_context().add_class("preset-btn")
+            ctx = btn.get_style_context()
+            ctx.add_class("preset-btn")
             btn.set_size_request(80, 35)
             btn.connect("clicked", self.on_preset_click, pid)
             flow.add(btn)
             self.preset_buttons[pid] = btn
+            self._preset_contexts[pid] = ctx
             
         page.pack_start(flow, False, False, 0)
         
@@ -759,180 +1273,189 @@ class SliderWindow(Gtk.Window):
         
         self.nav_stack.add_named(page, "break_page")
 
-    def apply_css(self):
-        css = b"""
-            /* Main Window */
-            window { background-color: #ffffff; }
-            .sidebar { background-color: #008080; color: white; }
-            .content-area { background-color: #ffffff; }
-            
-            /* Sidebar Buttons - Match CareUEyes style */
-            .nav-button {
-                background-image: none;
-                background-color: transparent;
-                color: white;
-                border: none;
-                border-radius: 0;
-                padding: 15px 20px;
-                font-weight: 600;
-                font-size: 14px;
-                text-shadow: none;
-                box-shadow: none;
-                -gtk-icon-shadow: none;
-            }
-            .nav-button label {
-                color: white;
-            }
-            .nav-button image {
-                color: white;
-                -gtk-icon-style: symbolic;
-            }
-            .nav-button:checked {
-                background-image: none;
-                background-color: #ffffff;
-                color: #009688;
-                border-radius: 0;
-            }
-            .nav-button:checked label {
-                color: #009688;
-            }
-            .nav-button:checked image {
-                color: #009688;
-                -gtk-icon-style: symbolic;
-            }
-            .nav-button:hover:not(:checked) {
-                background-color: #00695c;
-            }
-            
-            /* Sliders */
-            .thick-slider trough {
-                min-height: 8px;
-                border-radius: 4px;
-                background-color: #e0e0e0;
-            }
-            .thick-slider highlight {
-                min-height: 8px;
-                border-radius: 4px;
-                background-color: #009688; /* Teal */
-            }
-            .thick-slider slider {
-                min-width: 24px; min-height: 24px;
-                border-radius: 50%;
-                background-color: #ffffff;
-                border: 2px solid #009688;
-                box-shadow: 0 2px 4px rgba(0,0,0,0.2);
-            }
-            
-            /* Presets */
-            .preset-btn {
-                background-image: none;
-                background-color: #e0f2f1;
-                color: #00695c;
-                border: none;
-                border-radius: 4px;
-                box-shadow: none;
-            }
-            .preset-btn:hover { background-color: #b2dfdb; }
-            .preset-active { 
-                background-color: #009688; 
-                color: white; 
-            }
-            
-            /* Timer Page */
-            .timer-container {
-                background-color: #009688;
-                color: white;
-            }
-            .timer-digits {
-                font-size: 64px;
-                font-weight: bold;
-                color: white;
-            }
-            .timer-sublabel { font-size: 16px; color: #b2dfdb; }
-            
-            .orange-btn {
-                background-color: #ff9800;
-                color: white;
-                font-weight: bold;
-                border-radius: 20px;
-                border: none;
-            }
-            .orange-btn:hover { background-color: #f57c00; }
-            
-            .value-tag {
-                background-color: #009688;
-                color: white;
-                border-radius: 4px;
-                padding: 2px 6px;
-                font-size: 11px;
-            }
-            .grey-text { color: #888888; }
-            .flat-button { border: none; background: transparent; }
-        """
-        provider = Gtk.CssProvider()
-        provider.load_from_data(css)
-        Gtk.StyleContext.add_provider_for_screen(
-            self.get_screen(), provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-        )
-
+    def sync_from_tray(self):
+        """Move the sliders and labels to the tray's current levels."""
+        level = self.tray_app.current_level
+        temp = self.tray_app.warm_level
+        if temp == 0: temp = WARM_MAX
+        
+        self.set_slider_values(level, temp)
+        self.check_profile_match()
+    
+    def set_slider_values(self, level, temp):
+        """Move both sliders without feeding the change back to the tray."""
+        # Block slider signals during update to prevent feedback loop, and
+        # batch the adjustments' notify:: emissions into one per property
+        self.dim_scale.handler_block(self._dim_hid)
+        self.warm_scale.handler_block(self._warm_hid)
+        self.dim_adj.freeze_notify()
+        self.warm_adj.freeze_notify()
+        
+        self.dim_adj.set_value(_level_to_slider(level))
+        self.dim_val_label.set_label(_DIM_FMT[_level_to_slider(level)])
+        
+        # Update warm slider. Temp -> 0-100
+        self.warm_adj.set_value(_temp_to_slider(temp))
+        self.warm_val_label.set_label(_warm_text(temp))
+        
+        self.dim_adj.thaw_notify()
+        self.warm_adj.thaw_notify()
+        self.dim_scale.handler_unblock(self._dim_hid)
+        self.warm_scale.handler_unblock(self._warm_hid)
+        
+        # The blocked handlers did not see the move; record it for their early exit
+        self._last_level = level
+        self._last_temp = _slider_to_temp(self.warm_adj.get_value())
+    
     def on_nav_toggled(self, btn, page_name):
         if btn.get_active():
+            builder = self._page_builders.pop(page_name, None)
+            if builder is not None:
+                builder()
+                # The window's show_all() ran before this page existed
+                self.nav_stack.get_child_by_name(page_name).show_all()
             self.nav_stack.set_visible_child_name(page_name)
+            if page_name == "break_page":
+                self.start_timer_tick()
+            else:
+                self.stop_timer_tick()
+    
+    def start_timer_tick(self):
+        """Refresh the timer label now and then once a second."""
+        if self._timer_tick_src is None and self.update_timer_ui():
+            # Low priority so the clock yields to slider input
+            self._timer_tick_src = GLib.timeout_add_seconds(
+                1, self.update_timer_ui, priority=GLib.PRIORITY_LOW)
+    
+    def resume_timer_tick(self):
+        """Start the tick if the break page is currently on screen."""
+        if self.get_visible() and self.nav_stack.get_visible_child_name() == "break_page":
+            self.start_timer_tick()
+    
+    def on_window_shown(self, widget):
+        self.resume_timer_tick()
+    
+    def on_window_hidden(self, widget):
+        self.stop_timer_tick()
+    
+    def stop_timer_tick(self):
+        if self._timer_tick_src is not None:
+            GLib.source_remove(self._timer_tick_src)
+            self._timer_tick_src = None
     
     def on_hide_window(self, widget):
+        # Keep the widget tree alive; the tray re-presents this same window
         self.hide()
-        self.tray_app.on_slider_closed()
         return True
         
     def on_delete(self, widget, event):
-        self.on_hide_window(widget)
+        # True stops the default handler from destroying the window
+        self.hide()
         return True
 
     def on_dimmer_changed(self, widget):
-        if self.updating_from_profile:
-            return
-            
         # Slider is 0-100% Brightness
         # App expects Level 0 (100% bright) to 20 (0% bright)
-        slider_val = int(self.dim_adj.get_value())
+        level = _slider_to_level(self.dim_adj.get_value())
         
-        # Percentage of brightness: 100% -> Level 0. 0% -> Level 20.
-        dim_pct = 100 - slider_val
-        level = int(dim_pct / 5)
+        # Each level spans several slider values; ignore moves within one
+        if level == self._last_level:
+            return
+        self._last_level = level
+        # The value label is cheap, so it follows the drag; only the apply waits
+        self.dim_val_label.set_label(_DIM_FMT[_level_to_slider(level)])
+        
+        # Drags emit one signal per pixel; only the latest level per frame is applied
+        self._pending_level = level
+        if self._dim_timer_id == 0:
+            self._dim_timer_id = GLib.timeout_add(SLIDER_DEBOUNCE_MS, self._flush_level)
+    
+    def _flush_level(self):
+        """Apply the brightness level queued by on_dimmer_changed."""
+        self._dim_timer_id = 0
+        level = self._pending_level
         
         # Only apply if changed
         if self.tray_app.current_level != level:
             self.tray_app.set_dimmer_level(level)
-            self.dim_val_label.set_label(f"{slider_val}%")
-            self.check_profile_match()
+            self.queue_ui_refresh()
+        return False
             
     def on_warm_changed(self, widget):
-        if self.updating_from_profile:
-            return
-            
         # Slider is 0-100% Warmth
         # New Logic: 0 (Left/More Warm) => 2000K. 100 (Right/Less Warm) => 6500K.
-        slider_val = self.warm_adj.get_value()
+        temp = _slider_to_temp(self.warm_adj.get_value())
         
-        # Temp = 2000 + (val * 45)
-        temp = 2000 + (slider_val * 45)
-        # Snap to 100s
-        temp = int(round(temp / 100) * 100)
+        # Same early exit as on_dimmer_changed, on the snapped temperature
+        if temp == self._last_temp:
+            return
+        self._last_temp = temp
+        self.warm_val_label.set_label(_warm_text(temp))
+        
+        # Same coalescing as the brightness slider, with a longer window
+        self._pending_temp = temp
+        if self._warm_timer_id == 0:
+            self._warm_timer_id = GLib.timeout_add(WARM_DEBOUNCE_MS, self._flush_temp)
+    
+    def _flush_temp(self):
+        """Apply the warm temperature queued by on_warm_changed."""
+        self._warm_timer_id = 0
+        temp = self._pending_temp
         
         if self.tray_app.warm_level != temp:
             self.tray_app.set_warm_level(temp)
-            self.warm_val_label.set_label(f"{temp}K")
+            self.queue_ui_refresh()
+        return False
+    
+    def queue_ui_refresh(self):
+        """Update the preset highlight on the next idle."""
+        # The flush timers only push the new setting out; the purely visual
+        # follow-up waits so it never delays the overlay or Night Light update
+        if self._ui_idle_id == 0:
+            self._ui_idle_id = GLib.idle_add(self._refresh_ui)
+    
+    def _refresh_ui(self):
+        self._ui_idle_id = 0
+        self.refresh_profile_match()
+        return False
+    
+    def refresh_profile_match(self):
+        """Re-check the active preset, or defer it until the drag ends."""
+        if self._dragging:
+            self._profile_stale = True
+        else:
             self.check_profile_match()
     
+    def on_scale_pressed(self, widget, event):
+        self._dragging = True
+        return False
+    
+    def on_scale_released(self, widget, event):
+        """Apply any queued slider value at once when the drag ends."""
+        if self._dim_timer_id:
+            GLib.source_remove(self._dim_timer_id)
+            self._flush_level()
+        if self._warm_timer_id:
+            GLib.source_remove(self._warm_timer_id)
+            self._flush_temp()
+        
+        # One profile check for the whole drag
+        self._dragging = False
+        if self._profile_stale:
+            self._profile_stale = False
+            # A queued _refresh_ui will run the check itself
+            if self._ui_idle_id == 0:
+                self.check_profile_match()
+        return False  # Let the scale finish its own release handling
+    
     def format_dim_value(self, scale, value):
         """Format brightness slider value for display."""
-        return f"{int(value)}%"
+        return _DIM_FMT[int(value)]
     
     def format_warm_value(self, scale, value):
         """Format warm slider value for display as Kelvin."""
-        # 0 -> 2000, 100 -> 6500
-        temp = 2000 + (value * 45)
-        return f"{int(temp)}K"
+        # 0 -> 2000, 100 -> 6500, snapped like the temperature actually applied
+        return _warm_text(_slider_to_temp(value))
 
     def on_preset_click(self, widget, pid):
         # Set active button styling
@@ -943,40 +1466,28 @@ class SliderWindow(Gtk.Window):
             
         if pid == "pause":
             d_lvl = 0
-            w_temp = 6500
+            w_temp = WARM_MAX
         else:
             if pid in PROFILES:
-                d_lvl, w_temp, _, _ = PROFILES[pid]
+                profile = PROFILES[pid]
+                d_lvl, w_temp = profile.dim_level, profile.warm_temp
             else:
                 return
 
         # Apply to app
-        self.tray_app.set_dimmer_level(d_lvl)
-        self.tray_app.set_warm_level(w_temp)
-        
-        # Block slider signals during update to prevent feedback loop
-        self.updating_from_profile = True
+        self.tray_app.apply_settings(d_lvl, w_temp)
         
         # Update sliders
-        self.dim_adj.set_value(100 - (d_lvl * 5))
-        self.dim_val_label.set_label(f"{100 - (d_lvl * 5)}%")
-        
-        # Update warm slider. Temp -> 0-100
-        # Val = (Temp - 2000) / 45
-        slider_val = (w_temp - 2000) / 45
-        self.warm_adj.set_value(slider_val)
-        self.warm_val_label.set_label(f"{w_temp}K")
-        
-        # Re-enable slider signals
-        self.updating_from_profile = False
+        self.set_slider_values(d_lvl, w_temp)
         
     def update_active_button(self, active_pid):
-        for pid, btn in self.preset_buttons.items():
-            ctx = btn.get_style_context()
-            if pid == active_pid:
-                ctx.add_class("preset-active")
-            else:
-                ctx.remove_class("preset-active")
+        # Only the previously and newly active buttons change style
+        if active_pid == self._active_pid:
+            return
+        if self._active_pid is not None:
+            self._preset_contexts[self._active_pid].remove_class("preset-active")
+        self._preset_contexts[active_pid].add_class("preset-active")
+        self._active_pid = active_pid
                 
     def check_profile_match(self):
         # Check if current setting matches a profile
@@ -984,22 +1495,7 @@ class SliderWindow(Gtk.Window):
         curr_w = self.tray_app.warm_level
         if curr_w == 0: curr_w = 6500
         
-        found = False
-        
-        # Check pause
-        if curr_d == 0 and curr_w >= 6500:
-             self.update_active_button("pause")
-             return
-             
-        for pid, data in PROFILES.items():
-            d, w, _, _ = data
-            if curr_d == d and abs(curr_w - w) < 200: # Tolerance for temp
-                self.update_active_button(pid)
-                found = True
-                break
-        
-        if not found:
-            self.update_active_button("custom")
+        self.update_active_button(_match_profile(curr_d, curr_w))
         
     def on_break_toggled(self, switch, state):
         self.tray_app.break_enabled = state
@@ -1010,41 +1506,61 @@ class SliderWindow(Gtk.Window):
         self.break_switch.set_active(False)
 
     def update_timer_ui(self):
-        if self.tray_app.break_enabled:
-            # Simplistic countdown visualization
-            import time
-            remaining = "20:00" # Placeholder
-            self.timer_display.set_markup(f"<span font_features='tnum'>{remaining}</span>")
+        deadline = self.tray_app.break_deadline
+        if self.tray_app.break_enabled and deadline is not None:
+            remaining = max(0, int(deadline - time.monotonic()))
+            keep = GLib.SOURCE_CONTINUE
         else:
-            self.timer_display.set_label("00:20:00")
-        return True
+            # Static text while disabled; the tick restarts on re-enable
+            remaining = BREAK_INTERVAL_MINUTES * 60
+            keep = GLib.SOURCE_REMOVE
+            self._timer_tick_src = None
+        h, rem = divmod(remaining, 3600)
+        text = f"{h:02d}:{rem // 60:02d}:{rem % 60:02d}"
+        
+        # Leave the label alone (no relayout) when the text is unchanged
+        if text != self._last_timer_text:
+            self._last_timer_text = text
+            self.timer_display.set_markup(f"<span font_features='tnum'>{text}</span>")
+        return keep
 
 
 def main():
     """Main entry point."""
     global app
     
-    # Check if dimmer binary exists
-    if not os.path.isfile(DIMMER_BINARY):
-        print(f"Error: Dimmer binary not found at {DIMMER_BINARY}")
-        print("Please compile it first with:")
-        print("  gcc -o bin/dimmer_passthrough c_src/dimmer_passthrough.c -lX11 -lXext")
+    # Check that the dimmer binary exists and is executable with one stat()
+    try:
+        st = os.stat(DIMMER_BINARY)
+    except OSError:
+        st = None
+    if st is None or not stat.S_ISREG(st.st_mode):
+        sys.stdout.write("\n".join((
+            f"Error: Dimmer binary not found at {DIMMER_BINARY}",
+            "Please compile it first with:",
+            "  gcc -o bin/dimmer_passthrough c_src/dimmer_passthrough_20lvl.c -lX11 -lXext",
+        )) + "\n")
         return 1
     
-    # Check if binary is executable
-    if not os.access(DIMMER_BINARY, os.X_OK):
-        print(f"Error: Dimmer binary is not executable: {DIMMER_BINARY}")
-        print("Please run: chmod +x dimmer_passthrough")
+    if not st.st_mode & 0o111:
+        sys.stdout.write("\n".join((
+            f"Error: Dimmer binary is not executable: {DIMMER_BINARY}",
+            "Please run: chmod +x dimmer_passthrough",
+        )) + "\n")
         return 1
     
-    print("=" * 50)
-    print("Dimmer Tray started!")
-    print("=" * 50)
-    print(f"Binary: {DIMMER_BINARY}")
-    print("Look for the brightness icon in your system tray.")
-    print("Right-click the icon to access controls.")
-    print("Press Ctrl+C to quit.")
-    print("=" * 50)
+    rule = "=" * 50
+    sys.stdout.write("\n".join((
+        rule,
+        "Dimmer Tray started!",
+        rule,
+        f"Binary: {DIMMER_BINARY}",
+        "Look for the brightness icon in your system tray.",
+        "Right-click the icon to access controls.",
+        "Press Ctrl+C to quit.",
+        rule,
+    )) + "\n")
+    sys.stdout.flush()
     
     app = DimmerTray()
     app.run()
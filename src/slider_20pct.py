@@ -1,6 +1,11 @@
 #!/usr/bin/env python3
 import tkinter as tk
 import subprocess
+import os
+import time
+
+# Opened once and reused by every dimmer spawn
+devnull = os.open(os.devnull, os.O_RDWR)
 
 root = tk.Tk()
 root.title("Dimmer (20% steps)")
@@ -13,11 +18,66 @@ status = tk.StringVar(value="Dark (60%)")
 tk.Label(root, text="Brightness Control", font=('Arial',12,'bold')).pack(pady=10)
 tk.Label(root, textvariable=status).pack(pady=5)
 
+# A dimmer that failed to start or died is not retried for this long
+RETRY_SECONDS = 2
+dimmer = None
+retry_at = 0.0
+error = ""
+
+def dimmer_failed(message):
+    """Report a dead or missing dimmer and hold off respawning it."""
+    global dimmer, retry_at, error
+    dimmer = None
+    error = message
+    retry_at = time.monotonic() + RETRY_SECONDS
+    status.set(message)
+
+def start_dimmer(level=None):
+    """Spawn the dimmer in --stdin mode, reporting a failure in status."""
+    global dimmer
+    args = ['./dimmer_passthrough', '--stdin']
+    if level is not None:
+        args.append(str(level))
+    try:
+        dimmer = subprocess.Popen(args, stdin=subprocess.PIPE, stdout=devnull,
+                                  stderr=devnull, bufsize=0)
+    except OSError as e:
+        dimmer_failed(f"Dimmer unavailable: {e.strerror}")
+
+# Start the dimmer once and feed it levels over stdin
+start_dimmer()
+
+# Pending root.after id; drags are coalesced so only the last level is sent
+pending = None
+
+def apply_level(l):
+    global pending
+    pending = None
+    if dimmer is None:
+        # Failed earlier; only try again once the backoff has passed
+        if time.monotonic() < retry_at:
+            status.set(error)
+        else:
+            start_dimmer(l)
+        return
+    try:
+        dimmer.stdin.write(f"{l}\n".encode())
+    except OSError:
+        # The daemon exited (no display, wrong binary, killed); say how
+        code = dimmer.poll()
+        try:
+            dimmer.stdin.close()
+        except OSError:
+            pass
+        dimmer_failed("Dimmer stopped" if code is None else f"Dimmer exited with status {code}")
+
 def on_change(val):
+    global pending
     l = int(float(val))
     status.set(levels[l])
-    subprocess.run(['pkill','-f','dimmer_passthrough'], stderr=subprocess.DEVNULL)
-    subprocess.Popen(['./dimmer_passthrough', str(l)], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    if pending is not None:
+        root.after_cancel(pending)
+    pending = root.after(16, apply_level, l)
 
 slider = tk.Scale(root, from_=1, to=5, orient='horizontal', command=on_change)
 slider.set(3)
@@ -28,7 +88,11 @@ tk.Button(root, text="Dark", command=lambda: slider.set(3)).pack(side='left', pa
 tk.Button(root, text="Light", command=lambda: slider.set(1)).pack(side='left', padx=5, pady=5)
 
 def on_close():
-    subprocess.run(['pkill','-f','dimmer_passthrough'], stderr=subprocess.DEVNULL)
+    if dimmer is not None:
+        try:
+            dimmer.stdin.close()
+        except OSError:
+            pass
     root.destroy()
 
 root.protocol("WM_DELETE_WINDOW", on_close)
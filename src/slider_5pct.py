@@ -1,29 +1,85 @@
 #!/usr/bin/env python3
 import tkinter as tk
 import subprocess
+import os
+import time
+
+# Opened once and reused by every dimmer spawn
+devnull = os.open(os.devnull, os.O_RDWR)
 
 root = tk.Tk()
 root.title("Dimmer (5% steps)")
 root.geometry("350x180")
 root.attributes('-topmost', True)
 
-def get_level_name(l):
-    if l <= 4: return "Bright"
-    if l <= 10: return "Light"
-    if l <= 15: return "Dark"
-    return "Very Dark"
+# Name for each level 0-20, indexed directly by the slider value
+level_names = ("Bright",) * 5 + ("Light",) * 6 + ("Dark",) * 5 + ("Very Dark",) * 5
 
 status = tk.StringVar(value="50% - Light")
 
 tk.Label(root, text="Brightness Control (Fine)", font=('Arial',12,'bold')).pack(pady=10)
 tk.Label(root, textvariable=status).pack(pady=5)
 
+# A dimmer that failed to start or died is not retried for this long
+RETRY_SECONDS = 2
+dimmer = None
+retry_at = 0.0
+error = ""
+
+def dimmer_failed(message):
+    """Report a dead or missing dimmer and hold off respawning it."""
+    global dimmer, retry_at, error
+    dimmer = None
+    error = message
+    retry_at = time.monotonic() + RETRY_SECONDS
+    status.set(message)
+
+def start_dimmer(level=None):
+    """Spawn the dimmer in --stdin mode, reporting a failure in status."""
+    global dimmer
+    args = ['./dimmer_passthrough_20lvl', '--stdin']
+    if level is not None:
+        args.append(str(level))
+    try:
+        dimmer = subprocess.Popen(args, stdin=subprocess.PIPE, stdout=devnull,
+                                  stderr=devnull, bufsize=0)
+    except OSError as e:
+        dimmer_failed(f"Dimmer unavailable: {e.strerror}")
+
+# Start the dimmer once and feed it levels over stdin
+start_dimmer()
+
+# Pending root.after id; drags are coalesced so only the last level is sent
+pending = None
+
+def apply_level(l):
+    global pending
+    pending = None
+    if dimmer is None:
+        # Failed earlier; only try again once the backoff has passed
+        if time.monotonic() < retry_at:
+            status.set(error)
+        else:
+            start_dimmer(l)
+        return
+    try:
+        dimmer.stdin.write(f"{l}\n".encode())
+    except OSError:
+        # The daemon exited (no display, wrong binary, killed); say how
+        code = dimmer.poll()
+        try:
+            dimmer.stdin.close()
+        except OSError:
+            pass
+        dimmer_failed("Dimmer stopped" if code is None else f"Dimmer exited with status {code}")
+
 def on_change(val):
+    global pending
     l = int(float(val))
-    pct = l * 5
-    status.set(f"{pct}% - {get_level_name(l)}")
-    subprocess.run(['pkill','-f','dimmer_passthrough_20lvl'], stderr=subprocess.DEVNULL)
-    subprocess.Popen(['./dimmer_passthrough_20lvl', str(l)], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    status.set(f"{l * 5}% - {level_names[l]}")
+    if pending is not None:
+        root.after_cancel(pending)
+    pending = root.after(16, apply_level, l)
 
 slider = tk.Scale(root, from_=1, to=20, orient='horizontal', command=on_change, resolution=1)
 slider.set(10)
@@ -34,7 +90,11 @@ tk.Button(root, text="30%", command=lambda: slider.set(6)).pack(side='left', pad
 tk.Button(root, text="70%", command=lambda: slider.set(14)).pack(side='left', padx=5, pady=5)
 
 def on_close():
-    subprocess.run(['pkill','-f','dimmer_passthrough_20lvl'], stderr=subprocess.DEVNULL)
+    if dimmer is not None:
+        try:
+            dimmer.stdin.close()
+        except OSError:
+            pass
     root.destroy()
 
 root.protocol("WM_DELETE_WINDOW", on_close)